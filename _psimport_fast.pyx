@@ -0,0 +1,94 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_psimport_fast.pyx - Optional compiled parser for the numeric rows of Palmsense PStouch exports
+Used by psimport.py when available, which otherwise falls back to pandas
+Build with: python setup.py build_ext --inplace
+"""
+
+import numpy as np
+from cpython.exc cimport PyErr_Clear
+from cpython.ref cimport PyObject
+
+
+cdef extern from "Python.h":
+    # Declared here without the except clause of cpython.pystrtod: a field
+    # that is not a number is not an error for the parser
+    double PyOS_string_to_double(const char* s, char** endptr, PyObject* overflow_exception)
+
+
+cdef inline bint _is_field_end(const char* p, const char* end) noexcept nogil:
+    return p == end or p[0] == b',' or p[0] == b'\n' or p[0] == b'\r'
+
+
+cdef inline bint _is_blank(char c) noexcept nogil:
+    # Whitespace around a number that float() ignores, other than line endings
+    return c == b' ' or c == b'\t' or c == b'\v' or c == b'\f'
+
+
+def parse_csv_body(data, int n_cols):
+    """
+    Parses comma-separated numeric rows into a 2D array
+
+    Blank lines are skipped. Missing or non-numeric values, and columns
+    beyond n_cols, are left as NaN. Numbers are read like float() does,
+    whatever the C locale (no hexadecimal values or decimal commas).
+
+    Args:
+        data (bytes or bytearray): ASCII-compatible data rows, whose buffer
+                                   is NUL-terminated
+        n_cols (int): Number of columns to keep (two per scan)
+
+    Returns:
+        ndarray: Array of shape (rows, n_cols) with float64 values
+    """
+    # Upper bound on the number of rows, whatever the line endings
+    n_rows = data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n') + 1
+    out = np.full((n_rows, n_cols), np.nan)
+    cdef double[:, ::1] values = out
+    cdef const char* p = data
+    cdef const char* end = p + len(data)
+    cdef char* number_end
+    cdef const char* q
+    cdef const char* start
+    cdef double value
+    cdef Py_ssize_t row = 0
+    cdef Py_ssize_t col
+
+    while p < end:
+        # Skip blank lines
+        if p[0] == b'\n' or p[0] == b'\r':
+            p += 1
+            continue
+
+        col = 0
+        while True:
+            # Skip leading whitespace here, and never convert a field that is
+            # empty or only whitespace
+            q = p
+            while q < end and _is_blank(q[0]):
+                q += 1
+            if not _is_field_end(q, end):
+                start = q
+                value = PyOS_string_to_double(start, &number_end, NULL)
+                if <const char*>number_end == start:
+                    # Not a number: discard the ValueError that was set
+                    PyErr_Clear()
+                q = number_end
+                while q < end and _is_blank(q[0]):
+                    q += 1
+                if <const char*>number_end != start and col < n_cols and _is_field_end(q, end):
+                    values[row, col] = value
+
+            # Move to the end of the field (past any non-numeric text)
+            while not _is_field_end(q, end):
+                q += 1
+            col += 1
+
+            if q < end and q[0] == b',':
+                p = q + 1
+            else:
+                p = q
+                break
+        row += 1
+
+    return out[:row]
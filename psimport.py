@@ -8,27 +8,410 @@ Can export to various formats compatible with electrochemical analysis software
 """
 
 import os
+import io
+import re
 import sys
+import csv
+import mmap
+import array
+import codecs
 import argparse
 import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    # Compiled parser, built with: python setup.py build_ext --inplace
+    from _psimport_fast import parse_csv_body
+except ImportError:
+    parse_csv_body = None
+
+
+# Header rows of a PStouch export: scan names, measurement dates and the
+# column headers (V, µA) that precede the data rows
+_HEADER_RE = re.compile(r'(?P<scans>Cyclic Voltammetry)|(?P<dates>Date and time measurement:)|(?P<columns>V.*µA)')
+
+# Byte order marks and the BOM-less codec to decode the rest of the file with
+# (UTF-32 LE must be checked before UTF-16 LE, whose BOM is its prefix)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+
+def _detect_encoding(raw, encoding):
+    """
+    Determines how to decode the raw bytes of a file
+    
+    Args:
+        raw (bytes or mmap.mmap): Raw file content
+        encoding (str): Encoding requested by the user, used if there is no BOM
+        
+    Returns:
+        tuple: (bom_length, codec) with the number of BOM bytes to skip and a
+               codec that decodes the remaining bytes without expecting a BOM
+    """
+    for bom, codec in _BOMS:
+        if raw[:len(bom)] == bom:
+            return len(bom), codec
+    
+    # Without a BOM, Python's UTF-16/32 decoders assume little-endian, and
+    # UTF-8-SIG is plain UTF-8
+    name = codecs.lookup(encoding).name
+    if name in ('utf-16', 'utf-32'):
+        return 0, f"{name}-le"
+    if name == 'utf-8-sig':
+        return 0, 'utf-8'
+    return 0, encoding
+
+
+def _find_code_unit(raw, sep, pos, stop, width):
+    """
+    Finds an encoded character in raw bytes, ignoring matches that straddle
+    two code units of a UTF-16/32 file
+    
+    Args:
+        raw (bytes or mmap.mmap): Raw file content
+        sep (bytes): Encoded character to look for
+        pos (int): Byte offset to search from, at a code unit boundary
+        stop (int): Byte offset to search up to
+        width (int): Size of a code unit (1, 2 or 4 bytes)
+        
+    Returns:
+        int: Byte offset of the character, or -1 if not found
+    """
+    end = raw.find(sep, pos, stop)
+    while end != -1 and (end - pos) % width:
+        end = raw.find(sep, end + 1, stop)
+    return end
+
+
+def _read_lines(raw, start, codec, max_lines):
+    """
+    Decodes up to max_lines lines of raw bytes, keeping their line endings
+    
+    Like a file opened in text mode, lines end with '\n', '\r' or '\r\n'.
+    
+    Args:
+        raw (bytes or mmap.mmap): Raw file content
+        start (int): Byte offset of the first line
+        codec (str): BOM-less codec returned by _detect_encoding
+        max_lines (int): Maximum number of lines to decode
+        
+    Returns:
+        tuple: (lines, ends) with the decoded lines and the byte offset just
+               past each of them
+    """
+    newline = '\n'.encode(codec)
+    carriage_return = '\r'.encode(codec)
+    width = len(newline)  # Size of a code unit (1, 2 or 4 bytes)
+    lines = []
+    ends = []
+    pos = start
+    
+    newline_at = _find_code_unit(raw, newline, pos, len(raw), width)
+    
+    while len(lines) < max_lines and pos < len(raw):
+        # Search for the next newline only once the previous one is consumed,
+        # so a file without any is not scanned again for every line
+        if newline_at != -1 and newline_at < pos:
+            newline_at = _find_code_unit(raw, newline, pos, len(raw), width)
+        
+        # A carriage return before the newline ends the line, unless it is
+        # part of a '\r\n' pair
+        stop = len(raw) if newline_at == -1 else newline_at
+        cr = _find_code_unit(raw, carriage_return, pos, stop, width)
+        if cr != -1 and cr + width != newline_at:
+            end = cr + width
+        elif newline_at != -1:
+            end = newline_at + width
+        else:
+            end = len(raw)
+        lines.append(raw[pos:end].decode(codec))
+        ends.append(end)
+        pos = end
+    
+    return lines, ends
+
+
+# Size of the blocks UTF-16/32 data rows are transcoded in, a multiple of
+# every code unit size
+_TRANSCODE_BLOCK = 1 << 20
+
+
+def _iter_ascii(body, codec):
+    """
+    Transcodes data rows to ASCII one block at a time
+    
+    Characters outside ASCII become a non-numeric '?'.
+    
+    Args:
+        body (memoryview): Data rows
+        codec (str): BOM-less codec of the data rows
+        
+    Yields:
+        bytes: Transcoded rows of each block
+    """
+    decoder = codecs.getincrementaldecoder(codec)()
+    for start in range(0, len(body), _TRANSCODE_BLOCK):
+        text = decoder.decode(body[start:start + _TRANSCODE_BLOCK])
+        yield text.encode('ascii', errors='replace')
+    yield decoder.decode(b'', final=True).encode('ascii', errors='replace')
+
+
+class _BlockReader(io.RawIOBase):
+    """
+    Read-only binary stream over an iterable of bytes blocks, so pandas can
+    read transcoded rows without the whole body being held in memory
+    """
+    def __init__(self, blocks):
+        self._blocks = iter(blocks)
+        self._pending = memoryview(b'')
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        while not self._pending:
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._pending = memoryview(block)
+        
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _parse_rows(lines, n_cols):
+    """
+    Parses data rows in pure Python, for bodies rejected by the pandas C parser
+    
+    Like the original line-by-line parser, quotes get no special treatment.
+    
+    Args:
+        lines (iterable): Decoded data rows, read one at a time
+        n_cols (int): Number of columns to keep (two per scan)
+        
+    Returns:
+        ndarray: Array of shape (rows, n_cols), NaN where a value is missing
+                 or non-numeric
+    """
+    # The rows are streamed, so their number is unknown: collect the values
+    # as unboxed C doubles, which NumPy then wraps without a copy
+    data = array.array('d')
+    padding = array.array('d', [np.nan]) * n_cols
+    
+    for row in csv.reader(lines, quoting=csv.QUOTE_NONE):
+        if not row:
+            continue
+        
+        row = row[:n_cols]
+        try:
+            values = list(map(float, row))
+        except ValueError:
+            # Blank or non-numeric cells: convert one by one
+            values = []
+            for value in row:
+                try:
+                    values.append(float(value))
+                except ValueError:
+                    values.append(np.nan)
+        
+        data.extend(values)
+        data.extend(padding[len(values):])
+    
+    return np.frombuffer(data, dtype=np.float64).reshape(len(data) // max(n_cols, 1), n_cols)
+
+
+# Floating-point types for the precision option of VoltammetryImporter
+_PRECISIONS = {'single': np.float32, 'double': np.float64}
+
+
+def _to_float64(values):
+    """
+    Widens values to float64 keeping their shortest decimal representation
+    
+    A plain cast would turn a float32 -1.959991 into -1.9599909782409668 in
+    exported files; going through the float32 repr keeps -1.959991.
+    
+    Args:
+        values (ndarray): Values to widen
+        
+    Returns:
+        ndarray: float64 values
+    """
+    if values.dtype == np.float64:
+        return values
+    return values.astype(str).astype(np.float64)
+
+
+def _to_text_list(values):
+    """
+    Converts values to a list whose items print as their shortest repr
+    
+    float64 values become Python floats. float32 values are formatted by
+    NumPy instead, since as Python floats they would print the widened value
+    (-1.9599909782409668 instead of -1.959991).
+    
+    Args:
+        values (ndarray): Values to convert
+        
+    Returns:
+        list: Python floats or strings, one per value
+    """
+    if values.dtype == np.float64:
+        return values.tolist()
+    return values.astype(str).tolist()
+
+
+def _compact_scans(potentials, currents):
+    """
+    Moves the valid points of each scan to the front of its row
+    
+    A point is valid when both its potential and current are numeric; the
+    remaining slots are filled with NaN. The point order is preserved.
+    
+    Args:
+        potentials (ndarray): Potential values, one row per scan
+        currents (ndarray): Current values, one row per scan
+        
+    Returns:
+        tuple: (potentials, currents, points) with the compacted arrays and
+               the number of valid points in each scan
+    """
+    if _compact_scans_numba is not None and potentials.size >= _NUMBA_MIN_SIZE:
+        return _compact_scans_numba(potentials, currents)
+    
+    valid = ~np.isnan(potentials) & ~np.isnan(currents)
+    order = np.argsort(~valid, axis=1, kind='stable')
+    keep = np.take_along_axis(valid, order, axis=1)
+    return (np.where(keep, np.take_along_axis(potentials, order, axis=1), np.nan),
+            np.where(keep, np.take_along_axis(currents, order, axis=1), np.nan),
+            valid.sum(axis=1))
+
+
+# Loading a compiled Numba kernel takes longer than the NumPy versions need
+# for typical files: only use the kernels from this many values per array
+_NUMBA_MIN_SIZE = 10_000_000
+
+if numba is not None:
+    # Single pass per scan instead of the argsort/gather above. fastmath is
+    # left off on purpose: it lets the compiler assume values are never NaN.
+    @numba.njit(cache=True)
+    def _compact_scans_numba(potentials, currents):
+        scan_count, n_rows = potentials.shape
+        compact_potentials = np.full((scan_count, n_rows), np.nan, dtype=potentials.dtype)
+        compact_currents = np.full((scan_count, n_rows), np.nan, dtype=currents.dtype)
+        points = np.zeros(scan_count, dtype=np.int64)
+        
+        for i in range(scan_count):
+            n = 0
+            for j in range(n_rows):
+                potential = potentials[i, j]
+                current = currents[i, j]
+                if not (np.isnan(potential) or np.isnan(current)):
+                    compact_potentials[i, n] = potential
+                    compact_currents[i, n] = current
+                    n += 1
+            points[i] = n
+        
+        return compact_potentials, compact_currents, points
+else:
+    _compact_scans_numba = None
+
+
+def _scan_ranges(potentials, currents, points):
+    """
+    Computes the [min, max] potential and current range of each scan
+    
+    Args:
+        potentials (ndarray): Compacted potential values, one row per scan
+        currents (ndarray): Compacted current values, one row per scan
+        points (ndarray): Number of valid points in each scan
+        
+    Returns:
+        tuple: (potential_ranges, current_ranges), each of shape (scan_count, 2);
+               NaN for scans without points
+    """
+    if _scan_ranges_numba is not None and potentials.size >= _NUMBA_MIN_SIZE:
+        return _scan_ranges_numba(potentials, currents, points)
+    
+    # fmin/fmax skip the NaN padding without warning on empty scans
+    return (np.column_stack([np.fmin.reduce(potentials, axis=1), np.fmax.reduce(potentials, axis=1)]),
+            np.column_stack([np.fmin.reduce(currents, axis=1), np.fmax.reduce(currents, axis=1)]))
+
+
+if numba is not None:
+    # One fused min/max traversal of each scan, with scans spread across threads
+    @numba.njit(cache=True, parallel=True)
+    def _scan_ranges_numba(potentials, currents, points):
+        scan_count = potentials.shape[0]
+        potential_ranges = np.full((scan_count, 2), np.nan, dtype=potentials.dtype)
+        current_ranges = np.full((scan_count, 2), np.nan, dtype=currents.dtype)
+        
+        for i in numba.prange(scan_count):
+            if points[i] == 0:
+                continue
+            potential_min = potential_max = potentials[i, 0]
+            current_min = current_max = currents[i, 0]
+            for j in range(1, points[i]):
+                potential_min = min(potential_min, potentials[i, j])
+                potential_max = max(potential_max, potentials[i, j])
+                current_min = min(current_min, currents[i, j])
+                current_max = max(current_max, currents[i, j])
+            potential_ranges[i, 0] = potential_min
+            potential_ranges[i, 1] = potential_max
+            current_ranges[i, 0] = current_min
+            current_ranges[i, 1] = current_max
+        
+        return potential_ranges, current_ranges
+else:
+    _scan_ranges_numba = None
+
+
 class VoltammetryImporter:
-    def __init__(self, input_file=None, encoding='utf-16'):
+    def __init__(self, input_file=None, encoding='utf-16', precision='double'):
         """
         Initialize the cyclic voltammetry data importer for Palmsense PStouch files
         
         Args:
             input_file (str): Path to the CSV file exported from Palmsense PStouch to import
             encoding (str): File encoding (default: utf-16)
+            precision (str): 'double' to store data as float64, or 'single' for
+                             float32, which halves memory use but rounds values
+                             beyond ~7 significant digits (default: double)
         """
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Invalid precision '{precision}', expected 'single' or 'double'")
+        
         self.input_file = input_file
         self.encoding = encoding
-        self.scans = []
+        self.dtype = _PRECISIONS[precision]
         self.metadata = {}
         self.dates = []
         
+        # Scan data stored as parallel arrays: one row per scan, NaN-padded
+        # at the end when scans have different numbers of points
+        self.names = []
+        self.points = np.zeros(0, dtype=int)
+        self.potentials = np.empty((0, 0), dtype=self.dtype)  # V values
+        self.currents = np.empty((0, 0), dtype=self.dtype)    # µA values
+        self.potential_ranges = np.empty((0, 2), dtype=self.dtype)
+        self.current_ranges = np.empty((0, 2), dtype=self.dtype)
+        
+        # All-scans table shared by the CSV and Excel exports, built on first use
+        self._all_scans_df = None
+        
     def load_file(self, input_file=None):
         """
         Load a CSV file containing cyclic voltammetry data
@@ -41,141 +424,193 @@ class VoltammetryImporter:
         """
         if input_file:
             self.input_file = input_file
+        
+        self._all_scans_df = None
             
         if not self.input_file or not os.path.exists(self.input_file):
             print(f"Error: File {self.input_file} not found")
             return False
         
+        # Empty files cannot be memory-mapped
+        if os.path.getsize(self.input_file) == 0:
+            print(f"Error: File {self.input_file} is empty")
+            return False
+        
         try:
-            # Read the file with the specified encoding
-            with open(self.input_file, 'r', encoding=self.encoding) as f:
-                lines = f.readlines()
-            
-            # Extract basic information
-            if len(lines) > 0:
-                header_parts = lines[0].strip().split(',')
-                if len(header_parts) >= 2:
-                    self.metadata['date_time'] = header_parts[1].strip()
-            
-            # Look for scan names and measurement dates
-            scan_headers = []
-            measurement_dates = []
-            
-            for i, line in enumerate(lines[:10]):  # Check only the first few lines
-                if "Cyclic Voltammetry" in line:
-                    scan_headers = line.strip().split(',')
-                elif "Date and time measurement:" in line:
-                    measurement_dates = line.strip().split(',')
-            
-            # Extract scan names
-            scan_names = []
-            for part in scan_headers:
-                part = part.strip()
-                if part and "Cyclic Voltammetry" in part:
-                    scan_names.append(part)
-            
-            # Extract measurement dates
-            for part in measurement_dates:
-                part = part.strip()
-                if part and "Date and time measurement:" not in part:
-                    try:
-                        # Attempt to convert the string to a datetime object
-                        date_obj = datetime.strptime(part, "%Y-%m-%d %H:%M:%S")
-                        self.dates.append(date_obj)
-                    except (ValueError, TypeError):
-                        # Ignore if not a valid date
-                        pass
-            
-            # Look for the row with column headers (V, µA)
-            column_header_index = -1
-            for i, line in enumerate(lines[:20]):  # Check only the first few lines
-                if 'V' in line and 'µA' in line:
-                    column_header_index = i
-                    break
-            
-            if column_header_index == -1:
-                print("Error: Unable to find column headers (V, µA)")
-                return False
+            # Map the file instead of reading it: only the header prelude is
+            # decoded in Python, the data rows are parsed from the mapping
+            with open(self.input_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                return self._load_mapped(raw)
                 
-            # Get column headers
-            column_headers = lines[column_header_index].strip().split(',')
-            scan_count = len(column_headers) // 2  # Each scan has two columns (V and µA)
+        except Exception as e:
+            print(f"Error loading file: {str(e)}")
+            return False
+    
+    def _load_mapped(self, raw):
+        """
+        Loads scan data from the memory-mapped content of a CSV file
+        
+        Args:
+            raw (mmap.mmap): Memory-mapped file content
             
-            # Prepare data for each scan
-            self.scans = []
-            for i in range(scan_count):
-                scan_name = scan_names[i] if i < len(scan_names) else f"Scan {i+1}"
-                scan_date = self.dates[i] if i < len(self.dates) else None
-                
-                self.scans.append({
-                    'name': scan_name,
-                    'date': scan_date,
-                    'potential': [],  # V values
-                    'current': [],    # µA values
-                    'metadata': {}
-                })
+        Returns:
+            bool: True if loading succeeded, False otherwise
+        """
+        bom_length, codec = _detect_encoding(raw, self.encoding)
+        header_lines, line_ends = _read_lines(raw, bom_length, codec, 20)
+        
+        # Extract basic information
+        if len(header_lines) > 0:
+            header_parts = header_lines[0].strip().split(',')
+            if len(header_parts) >= 2:
+                self.metadata['date_time'] = header_parts[1].strip()
+        
+        # Look for scan names, measurement dates and the row with column
+        # headers (V, µA) in a single pass over the header prelude
+        scan_headers = []
+        measurement_dates = []
+        column_header_index = -1
+        
+        for i, line in enumerate(header_lines):
+            match = _HEADER_RE.search(line)
+            if match is None:
+                continue
+            if match.lastgroup == 'columns':
+                column_header_index = i
+                break
+            if match.lastgroup == 'scans':
+                scan_headers = line.strip().split(',')
+            else:
+                measurement_dates = line.strip().split(',')
+        
+        if column_header_index == -1:
+            print("Error: Unable to find column headers (V, µA)")
+            return False
+        
+        # Extract scan names
+        scan_names = []
+        for part in scan_headers:
+            part = part.strip()
+            if part and "Cyclic Voltammetry" in part:
+                scan_names.append(part)
+        
+        # Extract measurement dates (invalid dates are coerced to NaT and ignored)
+        candidates = [part.strip() for part in measurement_dates
+                      if part.strip() and "Date and time measurement:" not in part]
+        timestamps = pd.to_datetime(candidates, format="%Y-%m-%d %H:%M:%S", errors='coerce')
+        dates = [ts.to_pydatetime() for ts in timestamps if not pd.isna(ts)]
+        
+        # Get column headers
+        column_headers = header_lines[column_header_index].strip().split(',')
+        scan_count = len(column_headers) // 2  # Each scan has two columns (V and µA)
+        
+        # Data rows start after the headers; locate them in the mapped bytes
+        body_offset = line_ends[column_header_index]
+        data = self._parse_data(raw, body_offset, codec, scan_count * 2)
+        
+        n_rows = data.shape[0]
+        
+        # Reshape to (scan, V/µA, row) and split into potential and current arrays
+        scan_data = data.reshape(n_rows, scan_count, 2).transpose(1, 2, 0)
+        
+        # Keep only rows where both values are valid
+        potentials, currents, points = _compact_scans(scan_data[:, 0, :], scan_data[:, 1, :])
+        
+        # Verify that we actually loaded data (before touching the loaded
+        # scans, so a failed reload keeps the previous file consistent)
+        if scan_count == 0 or not points.any():
+            print("Error: No valid data found in the file")
+            return False
+        
+        n_points = points.max()
+        potentials = potentials[:, :n_points]
+        currents = currents[:, :n_points]
+        
+        # Add useful metadata
+        potential_ranges, current_ranges = _scan_ranges(potentials, currents, points)
+        
+        self.names = [scan_names[i] if i < len(scan_names) else f"Scan {i+1}"
+                      for i in range(scan_count)]
+        self.dates = dates
+        self.points = points
+        self.potentials = potentials
+        self.currents = currents
+        self.potential_ranges = potential_ranges
+        self.current_ranges = current_ranges
+        
+        return True
+    
+    def _parse_data(self, raw, body_offset, codec, n_cols):
+        """
+        Parses the data rows of a memory-mapped CSV file
+        
+        Args:
+            raw (mmap.mmap): Memory-mapped file content
+            body_offset (int): Byte offset of the first data row
+            codec (str): BOM-less codec of the file
+            n_cols (int): Number of columns to keep (two per scan)
             
-            # Parse data rows (starting from the row after the headers)
-            data_start_index = column_header_index + 1
+        Returns:
+            ndarray: Array of shape (rows, n_cols), NaN where a value is missing
+                     or non-numeric
+        """
+        # Zero-copy view of the data rows (released before the file is unmapped)
+        with memoryview(raw)[body_offset:] as body:
+            # The data rows are plain ASCII: transcode UTF-16/32 so the parser
+            # reads one byte per character (anything else becomes a non-numeric '?').
+            # Blocks are transcoded as they are parsed, never the whole body at once
+            transcoded = len('\n'.encode(codec)) > 1
+            row_codec = 'ascii' if transcoded else codec
             
-            for line_index in range(data_start_index, len(lines)):
-                line = lines[line_index].strip()
-                if not line:
-                    continue
-                
-                values = line.split(',')
-                
-                # Process each data point for each scan
-                for scan_index in range(scan_count):
-                    potential_index = scan_index * 2
-                    current_index = potential_index + 1
-                    
-                    if potential_index < len(values) and current_index < len(values):
-                        try:
-                            potential = float(values[potential_index])
-                            current = float(values[current_index])
-                            
-                            self.scans[scan_index]['potential'].append(potential)
-                            self.scans[scan_index]['current'].append(current)
-                        except ValueError:
-                            # Ignore non-numeric values
-                            pass
+            # Parse data rows with the compiled parser if built, otherwise with
+            # the pandas C parser; non-numeric or missing cells become NaN
+            if parse_csv_body is not None:
+                # The parser needs a NUL-terminated buffer: a bytes object, or
+                # a bytearray for transcoded rows, which can grow in place
+                if transcoded:
+                    rows = bytearray()
+                    for block in _iter_ascii(body, codec):
+                        rows += block
+                else:
+                    rows = bytes(body)
+                return parse_csv_body(rows, n_cols).astype(self.dtype, copy=False)
             
-            # Verify that we actually loaded data
-            if not self.scans or all(len(scan['potential']) == 0 for scan in self.scans):
-                print("Error: No valid data found in the file")
-                return False
-                
-            # Convert lists to NumPy arrays for better efficiency
-            for scan in self.scans:
-                scan['potential'] = np.array(scan['potential'])
-                scan['current'] = np.array(scan['current'])
-                
-                # Add useful metadata
-                scan['metadata']['points'] = len(scan['potential'])
-                if len(scan['potential']) > 0:
-                    scan['metadata']['potential_range'] = [
-                        float(np.min(scan['potential'])), 
-                        float(np.max(scan['potential']))
-                    ]
-                    scan['metadata']['current_range'] = [
-                        float(np.min(scan['current'])), 
-                        float(np.max(scan['current']))
-                    ]
+            if transcoded:
+                source = io.BufferedReader(_BlockReader(_iter_ascii(body, codec)))
+            else:
+                # pandas reads ASCII-compatible rows straight from the mapping
+                raw.seek(body_offset)
+                source = raw
             
-            return True
-                
-        except Exception as e:
-            print(f"Error loading file: {str(e)}")
-            return False
+            try:
+                # Read each column as one block (no mixed-type warning when the
+                # trailing BOM line ends up in it); like the other parsers,
+                # quotes get no special treatment
+                df = pd.read_csv(source, encoding=row_codec, header=None,
+                                 usecols=range(n_cols), engine='c', low_memory=False,
+                                 quoting=csv.QUOTE_NONE)
+                return df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=self.dtype)
+            except ValueError:
+                # Malformed rows (e.g. a stray quote), a first row shorter than
+                # the header or no rows at all: fall back to the Python parser,
+                # decoding the rows one line at a time (readline only splits on
+                # '\n', so rows ending with a lone '\r' are split afterwards)
+                if transcoded:
+                    source = io.BufferedReader(_BlockReader(_iter_ascii(body, codec)))
+                else:
+                    raw.seek(body_offset)
+                lines = codecs.iterdecode(iter(source.readline, b''), row_codec)
+                rows = (row for line in lines for row in line.splitlines())
+                return _parse_rows(rows, n_cols).astype(self.dtype, copy=False)
     
     def get_scan_count(self):
         """Returns the number of loaded scans"""
-        return len(self.scans)
+        return len(self.names)
     
     def get_scan_names(self):
         """Returns the list of scan names"""
-        return [scan['name'] for scan in self.scans]
+        return list(self.names)
     
     def get_scan_data(self, index):
         """
@@ -187,10 +622,47 @@ class VoltammetryImporter:
         Returns:
             dict: Dictionary with scan data
         """
-        if 0 <= index < len(self.scans):
-            return self.scans[index]
+        if 0 <= index < len(self.names):
+            points = int(self.points[index])
+            metadata = {'points': points}
+            if points > 0:
+                metadata['potential_range'] = _to_float64(self.potential_ranges[index]).tolist()
+                metadata['current_range'] = _to_float64(self.current_ranges[index]).tolist()
+            
+            return {
+                'name': self.names[index],
+                'date': self.dates[index] if index < len(self.dates) else None,
+                'potential': self.potentials[index, :points],
+                'current': self.currents[index, :points],
+                'metadata': metadata
+            }
         return None
     
+    def _all_scans_frame(self):
+        """
+        Returns a table with the data of all scans side by side
+        
+        The potential and current columns of each scan are interleaved and
+        NaN-padded to the longest scan, in the stored precision. The table is
+        built once per loaded file.
+        
+        Returns:
+            DataFrame: Table with two columns per scan
+        """
+        if self._all_scans_df is None:
+            scan_count = self.get_scan_count()
+            all_data = np.empty((self.potentials.shape[1], 2 * scan_count), dtype=self.potentials.dtype)
+            all_data[:, 0::2] = self.potentials.T
+            all_data[:, 1::2] = self.currents.T
+            
+            columns = []
+            for i in range(scan_count):
+                columns += [f"Scan_{i+1}_Potential_V", f"Scan_{i+1}_Current_µA"]
+            
+            self._all_scans_df = pd.DataFrame(all_data, columns=columns)
+        
+        return self._all_scans_df
+    
     def export_to_csv(self, output_file, scan_index=None):
         """
         Exports data from one or all scans to CSV format
@@ -206,8 +678,8 @@ class VoltammetryImporter:
         try:
             if scan_index is not None:
                 # Export a single scan
-                if 0 <= scan_index < len(self.scans):
-                    scan = self.scans[scan_index]
+                scan = self.get_scan_data(scan_index)
+                if scan is not None:
                     df = pd.DataFrame({
                         'Potential (V)': scan['potential'],
                         'Current (µA)': scan['current']
@@ -219,14 +691,7 @@ class VoltammetryImporter:
                     return False
             else:
                 # Export all scans to a single CSV
-                all_data = {}
-                for i, scan in enumerate(self.scans):
-                    scan_name = f"Scan_{i+1}"
-                    all_data[f"{scan_name}_Potential_V"] = pd.Series(scan['potential'])
-                    all_data[f"{scan_name}_Current_µA"] = pd.Series(scan['current'])
-                
-                df = pd.DataFrame(all_data)
-                df.to_csv(output_file, index=False)
+                self._all_scans_frame().to_csv(output_file, index=False)
                 return True
                 
         except Exception as e:
@@ -244,23 +709,22 @@ class VoltammetryImporter:
             bool: True if export succeeded, False otherwise
         """
         try:
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+            with pd.ExcelWriter(output_file, engine='xlsxwriter') as writer:
                 # Sheet with general metadata
                 metadata_df = pd.DataFrame([
                     ["Original file", os.path.basename(self.input_file)],
                     ["Import date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-                    ["Number of scans", len(self.scans)]
+                    ["Number of scans", self.get_scan_count()]
                 ], columns=["Property", "Value"])
                 
                 metadata_df.to_excel(writer, sheet_name='Metadata', index=False)
                 
                 # For each scan, create a separate worksheet
-                for i, scan in enumerate(self.scans):
+                for i in range(self.get_scan_count()):
+                    scan = self.get_scan_data(i)
                     # Create a dataframe for this scan
-                    df = pd.DataFrame({
-                        'Potential (V)': scan['potential'],
-                        'Current (µA)': scan['current']
-                    })
+                    df = pd.DataFrame(_to_float64(np.column_stack([scan['potential'], scan['current']])),
+                                      columns=['Potential (V)', 'Current (µA)'])
                     
                     # Write the dataframe to a worksheet
                     sheet_name = f"Scan_{i+1}"
@@ -268,18 +732,16 @@ class VoltammetryImporter:
                     
                     # Get the worksheet to add metadata
                     worksheet = writer.sheets[sheet_name]
-                    worksheet.cell(row=1, column=1, value=f"Name: {scan['name']}")
+                    worksheet.write(0, 0, f"Name: {scan['name']}")
                     
                     if scan['date']:
-                        worksheet.cell(row=2, column=1, value=f"Measurement date: {scan['date'].strftime('%Y-%m-%d %H:%M:%S')}")
+                        worksheet.write(1, 0, f"Measurement date: {scan['date'].strftime('%Y-%m-%d %H:%M:%S')}")
                 
-                # Also create a summary sheet with all data
-                all_data = {}
-                for i, scan in enumerate(self.scans):
-                    all_data[f"Scan_{i+1}_Potential_V"] = pd.Series(scan['potential'])
-                    all_data[f"Scan_{i+1}_Current_µA"] = pd.Series(scan['current'])
-                
-                all_df = pd.DataFrame(all_data)
+                # Also create a summary sheet with all data (Excel stores doubles,
+                # so float32 data is widened keeping its decimal values)
+                all_df = self._all_scans_frame()
+                if all_df.dtypes.iloc[0] != np.float64:
+                    all_df = pd.DataFrame(_to_float64(all_df.to_numpy()), columns=all_df.columns)
                 all_df.to_excel(writer, sheet_name='All_Scans', index=False)
                 
             return True
@@ -302,15 +764,19 @@ class VoltammetryImporter:
             bool: True if export succeeded, False otherwise
         """
         try:
-            if 0 <= scan_index < len(self.scans):
-                scan = self.scans[scan_index]
+            scan = self.get_scan_data(scan_index)
+            if scan is not None:
                 with open(output_file, 'w', encoding='utf-8') as f:
                     # Write header
                     f.write(f"Potential (V){delimiter}Current (µA)\n")
                     
-                    # Write data
-                    for i in range(len(scan['potential'])):
-                        f.write(f"{scan['potential'][i]}{delimiter}{scan['current'][i]}\n")
+                    # Write data (converting to Python values in bulk rather
+                    # than indexing NumPy scalars row by row)
+                    f.writelines(
+                        f"{potential}{delimiter}{current}\n"
+                        for potential, current in zip(_to_text_list(scan['potential']),
+                                                      _to_text_list(scan['current']))
+                    )
                         
                 return True
             else:
@@ -333,9 +799,8 @@ class VoltammetryImporter:
             bool: True if export succeeded, False otherwise
         """
         try:
-            if 0 <= scan_index < len(self.scans):
-                scan = self.scans[scan_index]
-                
+            scan = self.get_scan_data(scan_index)
+            if scan is not None:
                 # The CHI format is a proprietary format, but we can create a
                 # similar text file that might be compatible with some software
                 with open(output_file, 'w', encoding='utf-8') as f:
@@ -350,11 +815,12 @@ class VoltammetryImporter:
                     f.write(f"Points: {len(scan['potential'])}\n")
                     f.write("Header end\n")
                     
-                    # Write data
-                    for i in range(len(scan['potential'])):
-                        # Convert current from µA to A (format often used by CHI)
-                        current_A = scan['current'][i] * 1e-6
-                        f.write(f"{scan['potential'][i]}\t{current_A:.12e}\n")
+                    # Write data, converting current from µA to A (format often used by CHI)
+                    current_A = _to_float64(scan['current']) * 1e-6
+                    f.writelines(
+                        f"{potential}\t{current:.12e}\n"
+                        for potential, current in zip(_to_text_list(scan['potential']), current_A.tolist())
+                    )
                         
                 return True
             else:
@@ -374,10 +840,12 @@ def main():
                         help='Output format (default: excel)', default='excel')
     parser.add_argument('-s', '--scan', type=int, help='Index of the scan to export (0-based)', default=0)
     parser.add_argument('-e', '--encoding', help='Input file encoding (default: utf-16)', default='utf-16')
+    parser.add_argument('-p', '--precision', choices=['single', 'double'],
+                        help='Floating-point precision of the loaded data (default: double)', default='double')
     
     args = parser.parse_args()
     
-    importer = VoltammetryImporter(args.input_file, encoding=args.encoding)
+    importer = VoltammetryImporter(args.input_file, encoding=args.encoding, precision=args.precision)
     if not importer.load_file():
         sys.exit(1)
     
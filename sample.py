@@ -1,6 +1,7 @@
 # Example usage of psimport.py - For Palmsense PStouch data conversion
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from psimport import VoltammetryImporter
 
 def main():
@@ -41,10 +42,15 @@ def main():
         print("  Error exporting to Excel")
     
     # Export each scan individually to CSV format
+    # (exports only read the importer, so they can run in parallel threads)
     print("Exporting each scan to CSV...")
-    for i in range(scan_count):
-        csv_file = os.path.join(output_dir, f"scan_{i+1}.csv")
-        if importer.export_to_csv(csv_file, scan_index=i):
+    csv_files = [os.path.join(output_dir, f"scan_{i+1}.csv") for i in range(scan_count)]
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(
+            lambda i: importer.export_to_csv(csv_files[i], scan_index=i), range(scan_count)))
+    
+    for i, csv_file in enumerate(csv_files):
+        if results[i]:
             print(f"  Scan {i+1} exported to: {csv_file}")
         else:
             print(f"  Error exporting scan {i+1}")
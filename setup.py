@@ -0,0 +1,17 @@
+"""
+setup.py - Builds the optional compiled parser used by psimport.py
+Usage: python setup.py build_ext --inplace
+"""
+
+import numpy as np
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name='psimport',
+    py_modules=['psimport'],
+    ext_modules=cythonize(
+        [Extension('_psimport_fast', ['_psimport_fast.pyx'], include_dirs=[np.get_include()])],
+        language_level=3
+    ),
+)